@@ -6,11 +6,21 @@ from __future__ import annotations
 
 from decimal import Decimal as D
 from fractions import Fraction as F
-from functools import cached_property
-from itertools import count
-from math import comb, sqrt
+from functools import lru_cache
+from math import gcd, isqrt, sqrt
 from numbers import Real
-from typing import Optional, Union, overload
+from typing import Callable, Optional, Union, overload
+from weakref import WeakValueDictionary
+
+try:
+    from gmpy2 import mpq as _mpq
+except ImportError:
+    _mpq = None
+
+try:
+    from ._squarefree_nb import square_factors_int64 as _square_factors_int64
+except ImportError:
+    _square_factors_int64 = None
 
 
 class ABSqrtC:
@@ -18,7 +28,22 @@ class ABSqrtC:
     `a + b sqrt(c)` object
     """
 
-    _cache: dict[tuple[F, F, int], ABSqrtC] = {}
+    __slots__ = (
+        "_add",
+        "_factor",
+        "_radical",
+        "_value",
+        "_conjugate_product",
+        "_str",
+        "_hash",
+        "_conjugate",
+        "_inverse",
+        "__weakref__",
+    )
+
+    _cache: WeakValueDictionary[
+        tuple[int, int, int, int, int], ABSqrtC
+    ] = WeakValueDictionary()
 
     def __new__(
         cls,
@@ -27,54 +52,112 @@ class ABSqrtC:
         c: Optional[_InputTypesUnion] = None,
         /,
     ) -> ABSqrtC:
+        # Integer-only inputs never need Fraction wrapping: plain big-int
+        # arithmetic skips a gcd normalization per subsequent operation
+        if (
+            type(a) is int
+            and (bc is None or type(bc) is int)
+            and (c is None or type(c) is int)
+        ):
+            if bc is None:
+                int_b, int_c = 0, 1
+            elif c is None:
+                int_b, int_c = 1, bc
+            else:
+                int_b, int_c = bc, (c if bc else 1)
+
+            if int_c < 0:
+                raise ValueError(f"Negative radical {int_c} not yet supported")
+            elif not int_c:
+                int_c = 1
+
+            b_mul, int_c = _square_factors_int(int_c)
+            if int_c == 1:
+                a += int_b * b_mul
+                int_b = 0
+            elif b_mul != 1:
+                int_b *= b_mul
+
+            return cls._from_reduced(a, int_b, int_c)
+
         frac_a = a if isinstance(a, F) else F(a)
 
         if bc is None:
-            frac_b = F(0)
-            frac_c = F(1)
+            frac_b = _ZERO
+            frac_c = _ONE
         elif c is None:
-            frac_b = F(1)
+            frac_b = _ONE
             frac_c = bc if isinstance(bc, F) else F(bc)
         else:
             frac_b = bc if isinstance(bc, F) else F(bc)
-            frac_c = F(1) if not frac_b else c if isinstance(c, F) else F(c)
+            frac_c = _ONE if not frac_b else c if isinstance(c, F) else F(c)
 
         if frac_c < 0:
             raise ValueError(f"Negative radical {frac_c} not yet supported")
         elif not frac_c:
-            frac_c = F(1)
+            frac_c = _ONE
 
         b_mul, c = _get_square_factors(frac_c)
         if c == 1:
-            frac_a += frac_b * b_mul
-            frac_b = F(0)
-        else:
+            if frac_b:
+                frac_a += frac_b if b_mul == 1 else frac_b * b_mul
+                frac_b = _ZERO
+        elif b_mul != 1:
             frac_b *= b_mul
 
-        if (n := cls._cache.get((frac_a, frac_b, c))) is None:
-            obj: cls = super().__new__(cls)
-            obj._init(frac_a, frac_b, c)
-            cls._cache[frac_a, frac_b, c] = obj
+        return cls._from_reduced(frac_a, frac_b, c)
+
+    @classmethod
+    def _from_reduced(
+        cls, add: _RationalUnion, factor: _RationalUnion, radical: int
+    ) -> ABSqrtC:
+        """
+        Construct from an already square-free radical, skipping reduction
+
+        All internal arithmetic goes through here; the radical of an existing
+        instance is square-free by construction, so re-running
+        `_get_square_factors` on it would be pure waste
+        """
+        if not factor:
+            radical = 1
+
+        # Raw int keys sidestep Fraction.__hash__'s modular-inverse work,
+        # and int- and Fraction-built equal values share one key
+        key = (
+            add.numerator,
+            add.denominator,
+            factor.numerator,
+            factor.denominator,
+            radical,
+        )
+        if (n := cls._cache.get(key)) is None:
+            obj: ABSqrtC = super().__new__(cls)
+            obj._init(add, factor, radical)
+            cls._cache[key] = obj
             return obj
         else:
             return n
 
-    def _init(self, a: F, b: F, c: int) -> None:
+    def _init(self, a: _RationalUnion, b: _RationalUnion, c: int) -> None:
         self._add = a
         self._factor = b
         self._radical = c
 
-        self._value = a + b * sqrt(c)
-        self._conjugate_product = a * a - b * b * c
+        self._value: Optional[float] = None
+        self._conjugate_product: Optional[_RationalUnion] = None
+
+        self._str: Optional[str] = None
+        self._hash: Optional[int] = None
 
-        self._factor_abs = abs(b)
+        self._conjugate: Optional[ABSqrtC] = None
+        self._inverse: Optional[ABSqrtC] = None
 
     @property
-    def add(self) -> F:
+    def add(self) -> _RationalUnion:
         return self._add
 
     @property
-    def factor(self) -> F:
+    def factor(self) -> _RationalUnion:
         return self._factor
 
     @property
@@ -83,55 +166,88 @@ class ABSqrtC:
 
     @property
     def value(self) -> float:
+        """
+        Its float value, computed lazily on first access
+
+        Symbolic arithmetic never needs the float, so chains of operations
+        skip the big-int-to-float conversions entirely
+        """
+        if self._value is None:
+            if self._radical == 1:
+                self._value = float(self._add)
+            else:
+                self._value = float(self._add) + float(self._factor) * _get_sqrt(
+                    self._radical
+                )
         return self._value
 
     @property
-    def conjugate_product(self) -> F:
+    def conjugate_product(self) -> _RationalUnion:
         """
-        Product with its radical conjugate
+        Product with its radical conjugate, computed lazily on first use
+
+        Only the division paths need it, so plain add/mul chains skip the
+        three multiplications it costs
         """
+        if self._conjugate_product is None:
+            add = self._add
+            self._conjugate_product = add * add - _fmul3(
+                self._factor, self._factor, self._radical
+            )
         return self._conjugate_product
 
-    @cached_property
+    @property
     def conjugate(self) -> ABSqrtC:
         """
         Its radical conjugate
         """
-        return ABSqrtC(self._add, -self._factor, self._radical)
+        if self._conjugate is None:
+            self._conjugate = ABSqrtC._from_reduced(
+                self._add, -self._factor, self._radical
+            )
+        return self._conjugate
 
-    @cached_property
+    @property
     def inverse(self) -> ABSqrtC:
         """
         Its multiplicative inverse (1/self)
         """
-        return ABSqrtC(
-            self._add / self._conjugate_product,
-            -self._factor / self._conjugate_product,
-            self._radical,
-        )
-
-    def __del__(self) -> None:
-        type(self)._cache.pop((self._add, self._factor, self._radical), None)
+        if self._inverse is None:
+            inverse_cp = _ONE / self.conjugate_product
+            self._inverse = ABSqrtC._from_reduced(
+                self._add * inverse_cp, -self._factor * inverse_cp, self._radical
+            )
+        return self._inverse
 
     def __str__(self) -> str:
-        if not self._factor:
-            return f"{self._add or 0}"
+        if self._str is not None:
+            return self._str
 
-        if self._add:
-            string = f"{self._add} {'+' if self._factor > 0 else '-'} "
+        factor = self._factor
+        if not factor:
+            string = str(self._add)
         else:
-            string = "" if self._factor > 0 else "-"
+            parts: list[str] = []
+            if self._add:
+                parts.append(f"{self._add} {_SIGNS[factor > 0]}")
+            elif factor < 0:
+                parts.append("-")
+
+            factor_abs = abs(factor)
+            if factor_abs != 1:
+                parts.append(f"{factor_abs} * ")
 
-        if self._factor_abs != 1:
-            string += f"{self._factor_abs} * "
+            parts.append(f"√{self._radical}")
+            string = "".join(parts)
 
-        return string + f"√{self._radical}"
+        self._str = string
+        return string
 
     def __repr__(self) -> str:
         return f"ABSqrtC({str(self)})"
 
     def __format__(self, format_spec: str) -> str:
-        return self._value.__format__(format_spec)
+        return self.value.__format__(format_spec)
 
     def __eq__(self, o: object) -> bool:
         if isinstance(o, ABSqrtC):
@@ -141,7 +257,8 @@ class ABSqrtC:
                 and self._radical == o._radical
             )
         if isinstance(o, Real):
-            return self._value == o
+            # An irrational value can never equal a real rational exactly
+            return not self._factor and self._add == o
         return NotImplemented
 
     def __ne__(self, o: object) -> bool:
@@ -152,50 +269,87 @@ class ABSqrtC:
                 or self._radical != o._radical
             )
         if isinstance(o, Real):
-            return self._value != o
+            return bool(self._factor) or self._add != o
         return NotImplemented
 
     def __lt__(self, o: object) -> bool:
         if isinstance(o, ABSqrtC):
-            return self._value < o._value
-        if isinstance(o, Real):
-            return self._value < float(o)
+            return self._less_than(o)
+        if (other := _as_float(o)) is not None:
+            return self.value < other
         return NotImplemented
 
     def __le__(self, o: object) -> bool:
         if isinstance(o, ABSqrtC):
-            return self._value <= o._value
-        if isinstance(o, Real):
-            return self._value <= float(o)
+            return not o._less_than(self)
+        if (other := _as_float(o)) is not None:
+            return self.value <= other
         return NotImplemented
 
     def __gt__(self, o: object) -> bool:
         if isinstance(o, ABSqrtC):
-            return self._value > o._value
-        if isinstance(o, Real):
-            return self._value > float(o)
+            return o._less_than(self)
+        if (other := _as_float(o)) is not None:
+            return self.value > other
         return NotImplemented
 
     def __ge__(self, o: object) -> bool:
         if isinstance(o, ABSqrtC):
-            return self._value >= o._value
-        if isinstance(o, Real):
-            return self._value >= float(o)
+            return not self._less_than(o)
+        if (other := _as_float(o)) is not None:
+            return self.value >= other
         return NotImplemented
 
+    def _less_than(self, o: ABSqrtC) -> bool:
+        """
+        Exact `self < o` for compatible radicals, by integer sign analysis
+
+        `self < o` iff `d_a + d_f sqrt(r) > 0` for the coefficient
+        differences; when the signs of the differences disagree, squaring
+        decides without ever converting to float. Genuinely different
+        radicals fall back to float comparison
+        """
+        radical = self._radical
+        o_radical = o._radical
+        if radical != o_radical:
+            # A radical of 1 is compatible (its factor is 0)
+            if radical == 1:
+                radical = o_radical
+            elif o_radical != 1:
+                return self.value < o.value
+        d_add = o._add - self._add
+        d_factor = o._factor - self._factor
+        if not d_factor:
+            return d_add > 0
+        if d_factor > 0:
+            if d_add >= 0:
+                return True
+            return d_add * d_add < _fmul3(d_factor, d_factor, radical)
+        if d_add <= 0:
+            return False
+        return d_add * d_add > _fmul3(d_factor, d_factor, radical)
+
     def __hash__(self) -> int:
-        return self._value.__hash__()
+        if self._hash is None:
+            if self._factor:
+                self._hash = hash((self._add, self._factor, self._radical))
+            else:
+                # Match the hash of the equal Fraction/int/float
+                self._hash = hash(self._add)
+        return self._hash
 
     def __bool__(self) -> bool:
-        return self._value.__bool__()
+        return bool(self._add) or bool(self._factor)
 
     def __add__(self, o: object) -> ABSqrtC:
         if isinstance(o, ABSqrtC):
             radical = self.get_common_radical(o)
-            return ABSqrtC(self._add + o._add, self._factor + o._factor, radical)
-        if isinstance(o, _NumTypes):
-            return ABSqrtC(
-                self._add + (o if isinstance(o, F) else F(o)),
+            return ABSqrtC._from_reduced(
+                self._add + o._add, self._factor + o._factor, radical
+            )
+        if (scalar := _as_rational(o)) is not None:
+            return ABSqrtC._from_reduced(
+                self._add + scalar,
                 self._factor,
                 self._radical,
             )
@@ -204,10 +358,12 @@ class ABSqrtC:
     def __radd__(self, o: object) -> ABSqrtC:
         if isinstance(o, ABSqrtC):
             radical = o.get_common_radical(self)
-            return ABSqrtC(o._add + self._add, o._factor + self._factor, radical)
-        if isinstance(o, _NumTypes):
-            return ABSqrtC(
-                (o if isinstance(o, F) else F(o)) + self._add,
+            return ABSqrtC._from_reduced(
+                o._add + self._add, o._factor + self._factor, radical
+            )
+        if (scalar := _as_rational(o)) is not None:
+            return ABSqrtC._from_reduced(
+                scalar + self._add,
                 self._factor,
                 self._radical,
             )
@@ -216,10 +372,12 @@ class ABSqrtC:
     def __sub__(self, o: object) -> ABSqrtC:
         if isinstance(o, ABSqrtC):
             radical = self.get_common_radical(o)
-            return ABSqrtC(self._add - o._add, self._factor - o._factor, radical)
-        if isinstance(o, _NumTypes):
-            return ABSqrtC(
-                self._add - (o if isinstance(o, F) else F(o)),
+            return ABSqrtC._from_reduced(
+                self._add - o._add, self._factor - o._factor, radical
+            )
+        if (scalar := _as_rational(o)) is not None:
+            return ABSqrtC._from_reduced(
+                self._add - scalar,
                 self._factor,
                 self._radical,
             )
@@ -228,10 +386,12 @@ class ABSqrtC:
     def __rsub__(self, o: object) -> ABSqrtC:
         if isinstance(o, ABSqrtC):
             radical = o.get_common_radical(self)
-            return ABSqrtC(o._add - self._add, o._factor - self._factor, radical)
-        if isinstance(o, _NumTypes):
-            return ABSqrtC(
-                (o if isinstance(o, F) else F(o)) - self._add,
+            return ABSqrtC._from_reduced(
+                o._add - self._add, o._factor - self._factor, radical
+            )
+        if (scalar := _as_rational(o)) is not None:
+            return ABSqrtC._from_reduced(
+                scalar - self._add,
                 -self._factor,
                 self._radical,
             )
@@ -239,99 +399,160 @@ class ABSqrtC:
 
     def __mul__(self, o: object) -> ABSqrtC:
         if isinstance(o, ABSqrtC):
+            # A radical of 1 means a pure rational (factor is 0), so the
+            # product is a scalar multiple of the other operand
+            if self._radical == 1:
+                return ABSqrtC._from_reduced(
+                    self._add * o._add, self._add * o._factor, o._radical
+                )
+            if o._radical == 1:
+                return ABSqrtC._from_reduced(
+                    self._add * o._add, self._factor * o._add, self._radical
+                )
             radical = self.get_common_radical(o)
-            return ABSqrtC(
-                self._add * o._add + self._factor * o._factor * radical,
-                self._add * o._factor + self._factor * o._add,
+            return ABSqrtC._from_reduced(
+                *_mul_pair(self._add, self._factor, o._add, o._factor, radical),
                 radical,
             )
-        if isinstance(o, _NumTypes):
-            f_o = o if isinstance(o, F) else F(o)
-            return ABSqrtC(self._add * f_o, self._factor * f_o, self._radical)
+        if (scalar := _as_rational(o)) is not None:
+            return ABSqrtC._from_reduced(
+                self._add * scalar, self._factor * scalar, self._radical
+            )
         return NotImplemented
 
     def __rmul__(self, o: object) -> ABSqrtC:
         if isinstance(o, ABSqrtC):
+            if o._radical == 1:
+                return ABSqrtC._from_reduced(
+                    o._add * self._add, o._add * self._factor, self._radical
+                )
+            if self._radical == 1:
+                return ABSqrtC._from_reduced(
+                    o._add * self._add, o._factor * self._add, o._radical
+                )
             radical = o.get_common_radical(self)
-            return ABSqrtC(
-                o._add * self._add + o._factor * self._factor * radical,
-                o._add * self._factor + o._factor * self._add,
+            return ABSqrtC._from_reduced(
+                *_mul_pair(o._add, o._factor, self._add, self._factor, radical),
                 radical,
             )
-        if isinstance(o, _NumTypes):
-            f_o = o if isinstance(o, F) else F(o)
-            return ABSqrtC(f_o * self._add, f_o * self._factor, self._radical)
+        if (scalar := _as_rational(o)) is not None:
+            return ABSqrtC._from_reduced(
+                scalar * self._add, scalar * self._factor, self._radical
+            )
         return NotImplemented
 
     def __truediv__(self, o: object) -> ABSqrtC:
         if isinstance(o, ABSqrtC):
+            # A radical of 1 means a pure rational (factor is 0)
+            if o._radical == 1:
+                inverse_o = _ONE / o._add
+                return ABSqrtC._from_reduced(
+                    self._add * inverse_o, self._factor * inverse_o, self._radical
+                )
+            if self._radical == 1:
+                scale = self._add * (_ONE / o.conjugate_product)
+                return ABSqrtC._from_reduced(
+                    scale * o._add, -scale * o._factor, o._radical
+                )
             radical = self.get_common_radical(o)
-            return ABSqrtC(
-                (self._add * o._add - self._factor * o._factor * radical)
-                / o._conjugate_product,
-                (self._factor * o._add - self._add * o._factor) / o._conjugate_product,
-                radical,
+            inverse_cp = _ONE / o.conjugate_product
+            add, factor = _mul_pair(
+                self._add, self._factor, o._add, -o._factor, radical
+            )
+            return ABSqrtC._from_reduced(add * inverse_cp, factor * inverse_cp, radical)
+        if (scalar := _as_rational(o)) is not None:
+            inverse_o = _ONE / scalar
+            return ABSqrtC._from_reduced(
+                self._add * inverse_o, self._factor * inverse_o, self._radical
             )
-        if isinstance(o, _NumTypes):
-            f_o = o if isinstance(o, F) else F(o)
-            return ABSqrtC(self._add / f_o, self._factor / f_o, self._radical)
         return NotImplemented
 
     def __rtruediv__(self, o: object) -> ABSqrtC:
         if isinstance(o, ABSqrtC):
+            if self._radical == 1:
+                inverse_self = _ONE / self._add
+                return ABSqrtC._from_reduced(
+                    o._add * inverse_self, o._factor * inverse_self, o._radical
+                )
+            if o._radical == 1:
+                scale = o._add * (_ONE / self.conjugate_product)
+                return ABSqrtC._from_reduced(
+                    scale * self._add, -scale * self._factor, self._radical
+                )
             radical = o.get_common_radical(self)
-            return ABSqrtC(
-                (o._add * self._add - o._factor * self._factor * radical)
-                / self._conjugate_product,
-                (o._factor * self._add - o._add * self._factor)
-                / self._conjugate_product,
-                radical,
+            inverse_cp = _ONE / self.conjugate_product
+            add, factor = _mul_pair(
+                o._add, o._factor, self._add, -self._factor, radical
+            )
+            return ABSqrtC._from_reduced(add * inverse_cp, factor * inverse_cp, radical)
+        if (scalar := _as_rational(o)) is not None:
+            scale = scalar * (_ONE / self.conjugate_product)
+            return ABSqrtC._from_reduced(
+                scale * self._add, -scale * self._factor, self._radical
             )
-        if isinstance(o, _NumTypes):
-            factor = (o if isinstance(o, F) else F(o)) / self._conjugate_product
-            return ABSqrtC(factor * self._add, -factor * self._factor, self._radical)
         return NotImplemented
 
     def __pow__(self, o: object) -> ABSqrtC:
         if isinstance(o, int):
-            a = self._add
-            b = self._factor
-            c = self._radical
-            add = F(0)
-            factor = F(0)
-            for i in range(0, o, 2):
-                add += comb(o, i) * a ** (o - i) * b ** i * c ** (i // 2)
-                i += 1
-                factor += comb(o, i) * a ** (o - i) * b ** i * c ** (i // 2)
-            if not o % 2:
-                add += b ** o * c ** (o // 2)
-            return ABSqrtC(add, factor, self._radical)
+            if o < 0:
+                return self.inverse ** -o
+            radical = self._radical
+            if self._add.denominator == 1 == self._factor.denominator:
+                return ABSqrtC._from_reduced(
+                    *_pow_pair_int(
+                        self._add.numerator, self._factor.numerator, radical, o
+                    ),
+                    radical,
+                )
+            if _mpq is not None:
+                # GMP rationals do the same gcd-bound work in tuned C
+                add = _mpq(1)
+                factor = _mpq(0)
+                base_add = _mpq(self._add)
+                base_factor = _mpq(self._factor)
+                power = o
+                while power:
+                    if power & 1:
+                        add, factor = _mul_pair(
+                            add, factor, base_add, base_factor, radical
+                        )
+                    power >>= 1
+                    if power:
+                        base_add, base_factor = _sq_pair(base_add, base_factor, radical)
+                return ABSqrtC._from_reduced(
+                    F(int(add.numerator), int(add.denominator)),
+                    F(int(factor.numerator), int(factor.denominator)),
+                    radical,
+                )
+            return ABSqrtC._from_reduced(
+                *_pow_pair(self._add, self._factor, radical, o), radical
+            )
         return NotImplemented
 
     def __pos__(self) -> ABSqrtC:
         return self
 
     def __neg__(self) -> ABSqrtC:
-        return ABSqrtC(-self._add, -self._factor, self._radical)
+        return ABSqrtC._from_reduced(-self._add, -self._factor, self._radical)
 
     def __abs__(self) -> ABSqrtC:
         return (
             self
-            if self._value >= 0
-            else ABSqrtC(-self._add, -self._factor, self._radical)
+            if self.value >= 0
+            else ABSqrtC._from_reduced(-self._add, -self._factor, self._radical)
         )
 
     def __invert__(self) -> ABSqrtC:
-        return ABSqrtC(self._add, -self._factor, self._radical)
+        return ABSqrtC._from_reduced(self._add, -self._factor, self._radical)
 
     def __complex__(self) -> complex:
-        return self._value + 0j
+        return self.value + 0j
 
     def __float__(self) -> float:
-        return self._value
+        return self.value
 
     def __int__(self) -> int:
-        return self._value.__int__()
+        return self.value.__int__()
 
     @overload
     def __round__(self, ndigits: None = ...) -> int:
@@ -342,49 +563,256 @@ class ABSqrtC:
         ...
 
     def __round__(self, ndigits: Optional[int] = None) -> Union[int, float]:
-        return self._value.__round__(ndigits)
+        return self.value.__round__(ndigits)
 
     def __trunc__(self) -> int:
-        return self._value.__trunc__()
+        return self.value.__trunc__()
 
     def __floor__(self) -> int:
-        return self._value.__floor__()
+        return self.value.__floor__()
 
     def __ceil__(self) -> int:
-        return self._value.__ceil__()
+        return self.value.__ceil__()
 
     def get_common_radical(self, o: ABSqrtC) -> int:
         """
         Get common radicals of 2 ABSqrtC numbers
         """
-        if self._radical == o._radical:
-            return self._radical
-        if self._radical == 1:
-            return o._radical
-        if o._radical == 1:
-            return self._radical
+        radical = self._radical
+        o_radical = o._radical
+        if radical == o_radical or o_radical == 1:
+            return radical
+        if radical == 1:
+            return o_radical
         raise ValueError(
-            f"Different radicals ({self._radical} and {o._radical}) not yet supported"
+            f"Different radicals ({radical} and {o_radical}) not yet supported"
         )
 
 
-def _get_square_factors(n: F) -> tuple[F, int]:
+def _mul_pair(
+    add1: _RationalUnion,
+    factor1: _RationalUnion,
+    add2: _RationalUnion,
+    factor2: _RationalUnion,
+    radical: int,
+) -> tuple[_RationalUnion, _RationalUnion]:
     """
-    Separate all square factors of the number
+    Multiply `add1 + factor1 sqrt(radical)` by `add2 + factor2 sqrt(radical)`
+
+    Uses the Karatsuba identity `(a1 + f1)(a2 + f2) - a1 a2 - f1 f2` for the
+    cross term, saving one of the four fraction multiplications
+    """
+    plain = add1 * add2
+    mixed = factor1 * factor2
+    cross = (add1 + factor1) * (add2 + factor2) - plain - mixed
+    return plain + mixed * radical, cross
+
+
+def _sq_pair(
+    add: _RationalUnion, factor: _RationalUnion, radical: int
+) -> tuple[_RationalUnion, _RationalUnion]:
+    """
+    Square `add + factor sqrt(radical)`
+    """
+    plain = add * add
+    mixed = factor * factor
+    return plain + mixed * radical, 2 * add * factor
+
+
+def _pow_pair_int(add: int, factor: int, radical: int, power: int) -> tuple[int, int]:
+    """
+    Raise `add + factor sqrt(radical)` to `power` for integer coefficients
+
+    The common integer-coefficient case needs no denominator bookkeeping at
+    all: the loop is pure big-int multiply-add
+    """
+    result_add, result_factor = 1, 0
+    while power:
+        if power & 1:
+            result_add, result_factor = (
+                result_add * add + result_factor * factor * radical,
+                result_add * factor + result_factor * add,
+            )
+        power >>= 1
+        if power:
+            add, factor = (
+                add * add + factor * factor * radical,
+                2 * add * factor,
+            )
+    return result_add, result_factor
+
+
+def _pow_pair(add: F, factor: F, radical: int, power: int) -> tuple[F, F]:
+    """
+    Raise `add + factor sqrt(radical)` to `power` on raw integer pairs
+
+    Keeps the pair over one shared denominator, so the inner loop is pure
+    big-int arithmetic with no per-operation gcd normalization; the result
+    is normalized once at the end, with periodic reductions on the running
+    base to bound big-int growth on long chains
+    """
+    den = add.denominator * factor.denominator
+    base_add = add.numerator * factor.denominator
+    base_factor = factor.numerator * add.denominator
+    result_add, result_factor, result_den = 1, 0, 1
+    squarings = 0
+    while power:
+        if power & 1:
+            result_add, result_factor = (
+                result_add * base_add + result_factor * base_factor * radical,
+                result_add * base_factor + result_factor * base_add,
+            )
+            result_den *= den
+        power >>= 1
+        if power:
+            base_add, base_factor = (
+                base_add * base_add + base_factor * base_factor * radical,
+                2 * base_add * base_factor,
+            )
+            den *= den
+            squarings += 1
+            if not squarings & 7:
+                common = gcd(base_add, base_factor, den)
+                if common > 1:
+                    base_add //= common
+                    base_factor //= common
+                    den //= common
+    return F(result_add, result_den), F(result_factor, result_den)
+
+
+def _fmul3(x: _RationalUnion, y: _RationalUnion, k: int) -> _RationalUnion:
     """
-    square_factor = F(1, n.denominator)
-    n_int = n.numerator * n.denominator
+    `x * y * k` with a single gcd normalization at the end
+
+    Multiplying pairwise through Fraction normalizes twice; fusing the
+    triple product on raw numerators/denominators defers the gcd to one
+    call, and the result stays a plain int when no denominator survives
+    """
+    numerator = x.numerator * y.numerator * k
+    denominator = x.denominator * y.denominator
+    if denominator == 1:
+        return numerator
+    common = gcd(numerator, denominator)
+    if common > 1:
+        numerator //= common
+        denominator //= common
+        if denominator == 1:
+            return numerator
+    result = F.__new__(F)
+    result._numerator = numerator
+    result._denominator = denominator
+    return result
+
+
+def _as_float(o: object) -> Optional[float]:
+    """
+    Float value of a real scalar comparand, or `None` if unsupported
+
+    One shared dispatch for the four ordering dunders; the frozenset probe
+    catches the common concrete types before the slow `Real` ABC walk
+    """
+    if type(o) in _FAST_NUM_TYPES or isinstance(o, Real):
+        return float(o)
+    return None
+
 
-    for i in count(2):
+def _as_rational(o: object) -> Optional[_RationalUnion]:
+    """
+    Coerce a scalar operand to `Fraction`/`int`, or `None` if unsupported
+
+    Exact-type dispatch through `_COERCE` avoids walking four isinstance
+    checks on the hot `int`/`Fraction` paths; subclasses of the supported
+    types fall back to the tuple isinstance check
+    """
+    if (coerce := _COERCE.get(type(o))) is not None:
+        return coerce(o)
+    if isinstance(o, _NumTypes):
+        return F(o)
+    return None
+
+
+@lru_cache(maxsize=None)
+def _get_sqrt(radical: int) -> float:
+    """
+    Square root of an integer radical, cached across instances
+    """
+    return sqrt(radical)
+
+
+_WHEEL_INCREMENTS = (4, 2, 4, 2, 4, 6, 2, 6)
+
+
+@lru_cache(maxsize=None)
+def _square_factors_int(n: int) -> tuple[int, int]:
+    """
+    Separate all square factors of a positive integer
+
+    Peels the power of 2 with bit tricks, trial-divides by 3 and 5, then
+    steps a 2/3/5 wheel so only candidates coprime to 30 are probed,
+    stopping as soon as the trial square exceeds the remainder
+    """
+    if n < 4:
+        return 1, n
+
+    # Large radicands are divmod-bound; hand them to the native kernel.
+    # The upper guard keeps clear of int64 wraparound inside Numba
+    if _square_factors_int64 is not None and 24 < n.bit_length() < 63:
+        return _square_factors_int64(n)
+
+    root = isqrt(n)
+    if root * root == n:
+        # Perfect square: no factoring needed at all
+        return root, 1
+
+    square_factor = 1
+
+    twos = (n & -n).bit_length() - 1
+    if twos >= 2:
+        halved = twos >> 1
+        square_factor <<= halved
+        n >>= halved * 2
+
+    for prime in (3, 5):
+        square = prime * prime
+        while not n % square:
+            square_factor *= prime
+            n //= square
+
+    i = 7
+    index = 0
+    while i * i <= n:
         square = i * i
-        if square > n:
-            break
-        while not n_int % square:
+        while not n % square:
             square_factor *= i
-            n_int //= square
+            n //= square
+        i += _WHEEL_INCREMENTS[index]
+        index = (index + 1) & 7
+
+    return square_factor, n
+
+
+@lru_cache(maxsize=None)
+def _get_square_factors(n: F) -> tuple[F, int]:
+    """
+    Separate all square factors of the number
+    """
+    square_factor, remainder = _square_factors_int(n.numerator * n.denominator)
+    return F(square_factor, n.denominator), remainder
+
+
+_ZERO = F(0)
+_ONE = F(1)
 
-    return square_factor, n_int
+_SIGNS = ("- ", "+ ")
 
+_COERCE: dict[type, Callable[[object], _RationalUnion]] = {
+    int: lambda o: o,
+    F: lambda o: o,
+    D: F,
+    str: F,
+}
 
+_FAST_NUM_TYPES = frozenset((int, float, F, D))
 _NumTypes = (D, F, int, str)
 _InputTypesUnion = Union[D, F, int, str]
+_RationalUnion = Union[F, int]
@@ -2,34 +2,37 @@ from __future__ import annotations
 
 from decimal import Decimal as D
 from fractions import Fraction as F
-from functools import cached_property
 from numbers import Real
 from typing import Union, overload
+from weakref import WeakValueDictionary
 
 class ABSqrtC:
-    _cache: dict[tuple[F, F, int], ABSqrtC]
+    _cache: WeakValueDictionary[tuple[int, int, int, int, int], ABSqrtC]
     @overload
     def __new__(cls, a: _InputType, /) -> ABSqrtC: ...
     @overload
     def __new__(cls, a: _InputType, c: _InputType, /) -> ABSqrtC: ...
     @overload
     def __new__(cls, a: _InputType, b: _InputType, c: _InputType, /) -> ABSqrtC: ...
-    def _init(self, a: F, b: F, c: int) -> None: ...
+    @classmethod
+    def _from_reduced(
+        cls, add: _RationalUnion, factor: _RationalUnion, radical: int
+    ) -> ABSqrtC: ...
+    def _init(self, a: _RationalUnion, b: _RationalUnion, c: int) -> None: ...
     @property
-    def add(self) -> F: ...
+    def add(self) -> _RationalUnion: ...
     @property
-    def factor(self) -> F: ...
+    def factor(self) -> _RationalUnion: ...
     @property
     def radical(self) -> int: ...
     @property
     def value(self) -> float: ...
     @property
-    def conjugate_product(self) -> F: ...
-    @cached_property
+    def conjugate_product(self) -> _RationalUnion: ...
+    @property
     def conjugate(self) -> ABSqrtC: ...
-    @cached_property
+    @property
     def inverse(self) -> ABSqrtC: ...
-    def __del__(self) -> None: ...
     def __str__(self) -> str: ...
     def __repr__(self) -> str: ...
     def __format__(self, format_spec: str) -> str: ...
@@ -66,6 +69,12 @@ class ABSqrtC:
     def __ceil__(self) -> int: ...
     def get_common_radical(self, o: ABSqrtC) -> int: ...
 
+def _pow_pair_int(
+    add: int, factor: int, radical: int, power: int
+) -> tuple[int, int]: ...
+def _pow_pair(add: F, factor: F, radical: int, power: int) -> tuple[F, F]: ...
+
 _InputType = Union[D, F, int, str]
 _ComparisonType = Union[ABSqrtC, Real]
 _ArithmaticType = Union[ABSqrtC, D, F, int, str]
+_RationalUnion = Union[F, int]
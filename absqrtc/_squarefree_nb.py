@@ -0,0 +1,27 @@
+"""
+Module: optional Numba-compiled square-factor kernel for large radicands
+"""
+
+from __future__ import annotations
+
+from numba import njit
+
+
+@njit(cache=True)
+def square_factors_int64(n: int) -> tuple[int, int]:
+    """
+    Separate all square factors of a positive int64
+
+    Same contract as the pure-Python integer core; compiled to a native
+    trial-division loop for radicands too large for interpreted probing.
+    Callers must keep `n` inside int64 range - Numba wraps silently beyond
+    """
+    square_factor = 1
+    i = 2
+    while i * i <= n:
+        square = i * i
+        while n % square == 0:
+            square_factor *= i
+            n //= square
+        i += 1 if i == 2 else 2
+    return square_factor, n
@@ -0,0 +1,236 @@
+"""
+Module: batch operations on `a + b sqrt(c)` numbers sharing one radical
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction as F
+from typing import Any, Iterable, Iterator, Optional
+
+from . import ABSqrtC, _pow_pair, _pow_pair_int
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Sums of two entries below this bound cannot overflow int64
+_INT64_ADD_BOUND = 1 << 62
+# Products a1*a2 + f1*f2*radical stay within int64 for entries below this
+# bound as long as the radical fits in 31 bits
+_INT64_MUL_BOUND = 1 << 15
+
+
+class ABSqrtCArray:
+    """
+    Struct-of-arrays container for `ABSqrtC` values sharing one radical
+
+    The add and factor coefficients live in two parallel lists next to a
+    single shared radical, so batch arithmetic resolves the common radical
+    once, skips per-element input coercion and reduction, and boxes results
+    back into `ABSqrtC` objects only on demand
+    """
+
+    __slots__ = ("_adds", "_factors", "_radical")
+
+    def __init__(self, values: Iterable[ABSqrtC], /) -> None:
+        adds: list[F] = []
+        factors: list[F] = []
+        radical = 1
+        for value in values:
+            value_radical = value.radical
+            if value_radical != 1:
+                if radical == 1:
+                    radical = value_radical
+                elif value_radical != radical:
+                    raise ValueError(
+                        f"Different radicals ({radical} and {value_radical})"
+                        " not yet supported"
+                    )
+            adds.append(value.add)
+            factors.append(value.factor)
+        self._adds = adds
+        self._factors = factors
+        self._radical = radical
+
+    @classmethod
+    def _from_parts(
+        cls, adds: list[F], factors: list[F], radical: int
+    ) -> ABSqrtCArray:
+        """
+        Construct from coefficient lists whose radical is already shared
+        """
+        obj: ABSqrtCArray = super().__new__(cls)
+        obj._adds = adds
+        obj._factors = factors
+        obj._radical = radical
+        return obj
+
+    @property
+    def radical(self) -> int:
+        return self._radical
+
+    def __len__(self) -> int:
+        return len(self._adds)
+
+    def __getitem__(self, index: int) -> ABSqrtC:
+        return ABSqrtC._from_reduced(
+            self._adds[index], self._factors[index], self._radical
+        )
+
+    def __iter__(self) -> Iterator[ABSqrtC]:
+        for add, factor in zip(self._adds, self._factors):
+            yield ABSqrtC._from_reduced(add, factor, self._radical)
+
+    def __repr__(self) -> str:
+        return f"ABSqrtCArray([{', '.join(str(value) for value in self)}])"
+
+    def __eq__(self, o: object) -> bool:
+        if isinstance(o, ABSqrtCArray):
+            return len(self) == len(o) and all(
+                left == right for left, right in zip(self, o)
+            )
+        return NotImplemented
+
+    def __add__(self, o: object) -> ABSqrtCArray:
+        if isinstance(o, ABSqrtCArray):
+            radical = self._get_common_parts(o)
+            left = self._as_int64(_INT64_ADD_BOUND)
+            if (
+                left is not None
+                and (right := o._as_int64(_INT64_ADD_BOUND)) is not None
+            ):
+                return ABSqrtCArray._from_parts(
+                    (left[0] + right[0]).tolist(),
+                    (left[1] + right[1]).tolist(),
+                    radical,
+                )
+            return ABSqrtCArray._from_parts(
+                [a1 + a2 for a1, a2 in zip(self._adds, o._adds)],
+                [f1 + f2 for f1, f2 in zip(self._factors, o._factors)],
+                radical,
+            )
+        return NotImplemented
+
+    def __sub__(self, o: object) -> ABSqrtCArray:
+        if isinstance(o, ABSqrtCArray):
+            radical = self._get_common_parts(o)
+            left = self._as_int64(_INT64_ADD_BOUND)
+            if (
+                left is not None
+                and (right := o._as_int64(_INT64_ADD_BOUND)) is not None
+            ):
+                return ABSqrtCArray._from_parts(
+                    (left[0] - right[0]).tolist(),
+                    (left[1] - right[1]).tolist(),
+                    radical,
+                )
+            return ABSqrtCArray._from_parts(
+                [a1 - a2 for a1, a2 in zip(self._adds, o._adds)],
+                [f1 - f2 for f1, f2 in zip(self._factors, o._factors)],
+                radical,
+            )
+        return NotImplemented
+
+    def __mul__(self, o: object) -> ABSqrtCArray:
+        if isinstance(o, ABSqrtCArray):
+            radical = self._get_common_parts(o)
+            if radical < 1 << 31:
+                left = self._as_int64(_INT64_MUL_BOUND)
+                if (
+                    left is not None
+                    and (right := o._as_int64(_INT64_MUL_BOUND)) is not None
+                ):
+                    return ABSqrtCArray._from_parts(
+                        (
+                            left[0] * right[0] + left[1] * right[1] * radical
+                        ).tolist(),
+                        (left[0] * right[1] + left[1] * right[0]).tolist(),
+                        radical,
+                    )
+            adds: list[F] = []
+            factors: list[F] = []
+            for a1, f1, a2, f2 in zip(
+                self._adds, self._factors, o._adds, o._factors
+            ):
+                adds.append(a1 * a2 + f1 * f2 * radical)
+                factors.append(a1 * f2 + f1 * a2)
+            return ABSqrtCArray._from_parts(adds, factors, radical)
+        return NotImplemented
+
+    def __pow__(self, o: object) -> ABSqrtCArray:
+        if isinstance(o, int):
+            if o < 0:
+                results = [value ** o for value in self]
+                return ABSqrtCArray._from_parts(
+                    [result.add for result in results],
+                    [result.factor for result in results],
+                    self._radical,
+                )
+            radical = self._radical
+            adds: list[F] = []
+            factors: list[F] = []
+            for add, factor in zip(self._adds, self._factors):
+                if add.denominator == 1 == factor.denominator:
+                    add_int, factor_int = _pow_pair_int(
+                        add.numerator, factor.numerator, radical, o
+                    )
+                    adds.append(F(add_int))
+                    factors.append(F(factor_int))
+                else:
+                    add, factor = _pow_pair(add, factor, radical, o)
+                    adds.append(add)
+                    factors.append(factor)
+            return ABSqrtCArray._from_parts(adds, factors, radical)
+        return NotImplemented
+
+    def __neg__(self) -> ABSqrtCArray:
+        return ABSqrtCArray._from_parts(
+            [-add for add in self._adds],
+            [-factor for factor in self._factors],
+            self._radical,
+        )
+
+    def to_list(self) -> list[ABSqrtC]:
+        """
+        Box all entries into `ABSqrtC` objects
+        """
+        return list(self)
+
+    def _as_int64(self, bound: int) -> Optional[tuple[Any, Any]]:
+        """
+        Both coefficient columns as numpy int64 arrays, if safely possible
+
+        Requires numpy, all-integer entries and magnitudes below `bound` so
+        the caller's elementwise arithmetic cannot overflow int64; returns
+        `None` otherwise
+        """
+        if _np is None:
+            return None
+        for column in (self._adds, self._factors):
+            for value in column:
+                if value.__class__ is not int or not -bound < value < bound:
+                    return None
+        return (
+            _np.array(self._adds, dtype=_np.int64),
+            _np.array(self._factors, dtype=_np.int64),
+        )
+
+    def _get_common_parts(self, o: ABSqrtCArray) -> int:
+        """
+        Get the common radical of 2 equal-length ABSqrtCArrays
+        """
+        if len(self._adds) != len(o._adds):
+            raise ValueError(
+                f"Different lengths ({len(self._adds)} and {len(o._adds)})"
+            )
+        if self._radical == o._radical:
+            return self._radical
+        if self._radical == 1:
+            return o._radical
+        if o._radical == 1:
+            return self._radical
+        raise ValueError(
+            f"Different radicals ({self._radical} and {o._radical})"
+            " not yet supported"
+        )
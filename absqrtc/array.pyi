@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from fractions import Fraction as F
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from . import ABSqrtC
+
+class ABSqrtCArray:
+    _adds: list[_RationalUnion]
+    _factors: list[_RationalUnion]
+    _radical: int
+    def __init__(self, values: Iterable[ABSqrtC], /) -> None: ...
+    @classmethod
+    def _from_parts(
+        cls, adds: list[_RationalUnion], factors: list[_RationalUnion], radical: int
+    ) -> ABSqrtCArray: ...
+    @property
+    def radical(self) -> int: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> ABSqrtC: ...
+    def __iter__(self) -> Iterator[ABSqrtC]: ...
+    def __repr__(self) -> str: ...
+    def __eq__(self, o: object) -> bool: ...
+    def __add__(self, o: object) -> ABSqrtCArray: ...
+    def __sub__(self, o: object) -> ABSqrtCArray: ...
+    def __mul__(self, o: object) -> ABSqrtCArray: ...
+    def __pow__(self, o: int) -> ABSqrtCArray: ...
+    def __neg__(self) -> ABSqrtCArray: ...
+    def to_list(self) -> list[ABSqrtC]: ...
+    def _as_int64(self, bound: int) -> Optional[tuple[Any, Any]]: ...
+    def _get_common_parts(self, o: ABSqrtCArray) -> int: ...
+
+_RationalUnion = Union[F, int]
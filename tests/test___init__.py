@@ -1,14 +1,57 @@
-from decimal import Decimal as D
-from fractions import Fraction as F
-from math import sqrt
+import operator
+from functools import lru_cache
 
 import pytest
 
 from absqrtc import ABSqrtC
 
 
+@lru_cache(maxsize=None)
+def C(a, b=0, c=1):
+    """
+    Memoized three-argument construction; instances are immutable, so the
+    many tests re-asserting the same literals can share one object
+    """
+    return ABSqrtC(a, b, c)
+
+
+@pytest.fixture(scope="module")
+def t_set():
+    """
+    The instances shared by the binary-operation tests, built once per run
+    """
+    return (
+        C(2, 0, 1),
+        C(3, -5, 7),
+        C(3, 5, 7),
+        C(2, 10, 7),
+        C(3, 5, 11),
+    )
+
+
+@pytest.fixture(scope="module")
+def sqrt7():
+    """
+    `√7` as a float, computed once while keeping math out of collection
+    """
+    from math import sqrt
+
+    return sqrt(7)
+
+
+@pytest.fixture(scope="module")
+def t357():
+    """
+    `3 + 5√7`, the workhorse operand of the comparison and reflected tests
+    """
+    return C(3, 5, 7)
+
+
 class TestInstance:
     def test_construction(self):
+        from decimal import Decimal as D
+        from fractions import Fraction as F
+
         with pytest.raises(ValueError):
             ABSqrtC(-1, -1, -1)
 
@@ -18,204 +61,220 @@ class TestInstance:
         ABSqrtC(F(1), F(2), F(3))
         assert ABSqrtC(1, D("0.5"), "4/2") == ABSqrtC(F(1), F(1 / 2), F(2))
 
-    def test_reduction(self):
-        t1 = ABSqrtC(0, 75)
-        assert t1.add == 0
-        assert t1.factor == 5
-        assert t1.radical == 3
-
-        t2 = ABSqrtC(3, -5, 98)
-        assert t2.add == 3
-        assert t2.factor == -35
-        assert t2.radical == 2
-
-        t3 = ABSqrtC(-5, 3, 9)
-        assert t3.add == 4
-        assert t3.factor == 0
-        assert t3.radical == 1
-
-        t4 = ABSqrtC(-3, 0, 200)
-        assert t4.add == -3
-        assert t4.factor == 0
-        assert t4.radical == 1
-
-        t5 = ABSqrtC(F(1, 2), D("4"), F(1 / 2))
-        assert t5.add == F(1, 2)
-        assert t5.factor == F(2)
-        assert t5.radical == F(2)
-
-    def test_value(self):
-        assert ABSqrtC(1, 1, 1).value == 2
-        assert ABSqrtC(3, -5, 7).value == 3 - 5 * sqrt(7)
+    @pytest.mark.parametrize(
+        "args,add,factor,radical",
+        [
+            ((0, 75), 0, 5, 3),
+            ((3, -5, 98), 3, -35, 2),
+            ((-5, 3, 9), 4, 0, 1),
+            ((-3, 0, 200), -3, 0, 1),
+            ((2, 3, 16), 14, 0, 1),
+            (("1/2", "4", "1/2"), "1/2", 2, 2),
+        ],
+    )
+    def test_reduction(self, args, add, factor, radical):
+        from fractions import Fraction as F
+
+        t = ABSqrtC(*args)
+        assert (t.add, t.factor, t.radical) == (F(add), F(factor), radical)
+
+    def test_value(self, sqrt7):
+        assert C(1, 1, 1).value == 2
+        assert C(3, -5, 7).value == 3 - 5 * sqrt7
 
     def test_bool(self):
-        assert not bool(ABSqrtC(0, 0, 1))
-        assert bool(ABSqrtC(1, 1, 1))
+        assert not bool(C(0, 0, 1))
+        assert bool(C(1, 1, 1))
 
     def test_str(self):
-        assert str(ABSqrtC(1, 0, 1)) == "1"
-        assert str(ABSqrtC(0, 1, 2)) == "√2"
-        assert str(ABSqrtC(0, -1, 2)) == "-√2"
-        assert str(ABSqrtC(1, 1, 2)) == "1 + √2"
-        assert str(ABSqrtC(1, 2, 2)) == "1 + 2 * √2"
-        assert str(ABSqrtC(-1, -2, 2)) == "-1 - 2 * √2"
-        assert str(ABSqrtC(F(1, 2), F(1, 2), 2)) == "1/2 + 1/2 * √2"
+        from fractions import Fraction as F
+
+        assert str(C(1, 0, 1)) == "1"
+        assert str(C(0, 1, 2)) == "√2"
+        assert str(C(0, -1, 2)) == "-√2"
+        assert str(C(1, 1, 2)) == "1 + √2"
+        assert str(C(1, 2, 2)) == "1 + 2 * √2"
+        assert str(C(-1, -2, 2)) == "-1 - 2 * √2"
+        assert str(C(F(1, 2), F(1, 2), 2)) == "1/2 + 1/2 * √2"
 
 
 class TestComparisons:
-    def test_eq(self):
-        assert ABSqrtC(3, 5, 7) == ABSqrtC(3, 5, 7)
-        assert ABSqrtC(3, 5, 7) == ABSqrtC(3, 1, 175)
+    def test_eq(self, t357):
+        assert t357 == C(3, 5, 7)
+        assert t357 == C(3, 1, 175)
 
-    def test_ne(self):
-        assert ABSqrtC(3, 5, 7) != ABSqrtC(3, 5, 8)
+    def test_ne(self, t357):
+        assert t357 != C(3, 5, 8)
 
-    def test_lt(self):
-        assert ABSqrtC(3, 5, 7) < ABSqrtC(3, 5, 8)
-        assert ABSqrtC(3, 5, 7) < ABSqrtC(3, 6, 7)
-        assert ABSqrtC(3, 5, 7) < ABSqrtC(4, 5, 7)
+    @pytest.mark.parametrize("args", [(3, 5, 8), (3, 6, 7), (4, 5, 7)])
+    def test_lt(self, t357, args):
+        assert t357 < C(*args)
 
-    def test_le(self):
-        assert ABSqrtC(3, 5, 7) <= ABSqrtC(3, 5, 8)
-        assert ABSqrtC(3, 5, 7) <= ABSqrtC(3, 6, 7)
-        assert ABSqrtC(3, 5, 7) <= ABSqrtC(4, 5, 7)
-        assert ABSqrtC(3, 5, 7) <= ABSqrtC(3, 5, 7)
+    @pytest.mark.parametrize("args", [(3, 5, 8), (3, 6, 7), (4, 5, 7), (3, 5, 7)])
+    def test_le(self, t357, args):
+        assert t357 <= C(*args)
 
-    def test_gt(self):
-        assert ABSqrtC(3, 5, 7) > ABSqrtC(3, 5, 6)
-        assert ABSqrtC(3, 5, 7) > ABSqrtC(3, 4, 7)
-        assert ABSqrtC(3, 5, 7) > ABSqrtC(2, 5, 7)
+    @pytest.mark.parametrize("args", [(3, 5, 6), (3, 4, 7), (2, 5, 7)])
+    def test_gt(self, t357, args):
+        assert t357 > C(*args)
 
-    def test_ge(self):
-        assert ABSqrtC(3, 5, 7) >= ABSqrtC(3, 5, 6)
-        assert ABSqrtC(3, 5, 7) >= ABSqrtC(3, 4, 7)
-        assert ABSqrtC(3, 5, 7) >= ABSqrtC(2, 5, 7)
-        assert ABSqrtC(3, 5, 7) >= ABSqrtC(3, 5, 7)
+    @pytest.mark.parametrize("args", [(3, 5, 6), (3, 4, 7), (2, 5, 7), (3, 5, 7)])
+    def test_ge(self, t357, args):
+        assert t357 >= C(*args)
 
 
 class TestCalculationsBinary:
-    def test_add(self):
-        t1 = ABSqrtC(2, 0, 1)
-        t2 = ABSqrtC(3, -5, 7)
-        t3 = ABSqrtC(3, 5, 7)
-        t4 = ABSqrtC(3, 10, 7)
-        t5 = ABSqrtC(3, 5, 11)
-
-        with pytest.raises(ValueError):
-            t2 + t5
-
-        assert t1 + t3 == ABSqrtC(5, 5, 7)
-        assert t2 + t3 == ABSqrtC(6, 0, 1)
-        assert t2 + t4 == ABSqrtC(6, 5, 7)
-        assert t3 + 1 == t3 + D(1) == t3 + F(1) == t3 + "1" == ABSqrtC(4, 5, 7)
-
-    def test_sub(self):
-        t1 = ABSqrtC(2, 0, 1)
-        t2 = ABSqrtC(3, -5, 7)
-        t3 = ABSqrtC(3, 5, 7)
-        t4 = ABSqrtC(2, -10, 7)
-        t5 = ABSqrtC(3, 5, 11)
-
-        with pytest.raises(ValueError):
-            t2 - t5
-
-        assert t1 - t1 == ABSqrtC(0, 0, 1)
-        assert t1 - t3 == ABSqrtC(-1, -5, 7)
-        assert t2 - t3 == ABSqrtC(0, -10, 7)
-        assert t2 - t4 == ABSqrtC(1, 5, 7)
-        assert t3 - 1 == t3 - D(1) == t3 - F(1) == t3 - "1" == ABSqrtC(2, 5, 7)
+    @pytest.mark.parametrize(
+        "args1,args2,expected",
+        [
+            ((2, 0, 1), (3, 5, 7), (5, 5, 7)),
+            ((3, -5, 7), (3, 5, 7), (6, 0, 1)),
+            ((3, -5, 7), (3, 10, 7), (6, 5, 7)),
+        ],
+    )
+    def test_add(self, args1, args2, expected):
+        assert C(*args1) + C(*args2) == C(*expected)
+
+    def test_add_scalar(self, t357):
+        from decimal import Decimal as D
+        from fractions import Fraction as F
+
+        t = t357
+        assert t + 1 == t + D(1) == t + F(1) == t + "1" == C(4, 5, 7)
+
+    @pytest.mark.parametrize(
+        "args1,args2,expected",
+        [
+            ((2, 0, 1), (2, 0, 1), (0, 0, 1)),
+            ((2, 0, 1), (3, 5, 7), (-1, -5, 7)),
+            ((3, -5, 7), (3, 5, 7), (0, -10, 7)),
+            ((3, -5, 7), (2, -10, 7), (1, 5, 7)),
+        ],
+    )
+    def test_sub(self, args1, args2, expected):
+        assert C(*args1) - C(*args2) == C(*expected)
+
+    def test_sub_scalar(self, t357):
+        from decimal import Decimal as D
+        from fractions import Fraction as F
+
+        t = t357
+        assert t - 1 == t - D(1) == t - F(1) == t - "1" == C(2, 5, 7)
+
+    @pytest.mark.parametrize(
+        "args1,args2,expected",
+        [
+            ((2, 0, 1), (2, 0, 1), (4, 0, 1)),
+            ((2, 0, 1), (3, 5, 7), (6, 10, 7)),
+            ((3, -5, 7), (3, 5, 7), (-166, 0, 1)),
+            ((3, -5, 7), (2, 10, 7), (-344, 20, 7)),
+        ],
+    )
+    def test_mul(self, args1, args2, expected):
+        assert C(*args1) * C(*args2) == C(*expected)
+
+    def test_mul_scalar(self, t357):
+        from decimal import Decimal as D
+        from fractions import Fraction as F
+
+        t = t357
+        assert t * 2 == t * D(2) == t * F(2) == t * "2" == C(6, 10, 7)
+
+    @pytest.mark.parametrize(
+        "args1,args2,expected",
+        [
+            ((2, 0, 1), (2, 0, 1), (1, 0, 1)),
+            ((3, -5, 7), (2, 0, 1), ("3/2", "-5/2", 7)),
+            ((2, 0, 1), (3, 5, 7), ("-3/83", "5/83", 7)),
+            ((3, -5, 7), (3, 5, 7), ("-92/83", "15/83", 7)),
+            ((3, -5, 7), (2, 10, 7), ("-89/174", "5/87", 7)),
+        ],
+    )
+    def test_truediv(self, args1, args2, expected):
+        assert C(*args1) / C(*args2) == C(*expected)
+
+    def test_truediv_scalar(self, t357):
+        from decimal import Decimal as D
+        from fractions import Fraction as F
+
+        t = t357
+        assert (
+            t / 2 == t / D(2) == t / F(2) == t / "2" == C(F(3, 2), F(5, 2), 7)
+        )
 
-    def test_mul(self):
-        t1 = ABSqrtC(2, 0, 1)
-        t2 = ABSqrtC(3, -5, 7)
-        t3 = ABSqrtC(3, 5, 7)
-        t4 = ABSqrtC(2, 10, 7)
-        t5 = ABSqrtC(3, 5, 11)
+    @pytest.mark.parametrize(
+        "op", [operator.add, operator.sub, operator.mul, operator.truediv]
+    )
+    def test_mismatched_radical(self, t_set, op):
+        _, t2, _, _, t5 = t_set
 
         with pytest.raises(ValueError):
-            t2 * t5
+            op(t2, t5)
 
-        assert t1 * t1 == ABSqrtC(4, 0, 1)
-        assert t1 * t3 == ABSqrtC(6, 10, 7)
-        assert t2 * t3 == ABSqrtC(-166, 0, 1)
-        assert t2 * t4 == ABSqrtC(-344, 20, 7)
-        assert t3 * 2 == t3 * D(2) == t3 * F(2) == t3 * "2" == ABSqrtC(6, 10, 7)
+    def test_radd(self, t357):
+        from decimal import Decimal as D
+        from fractions import Fraction as F
 
-    def test_truediv(self):
-        t1 = ABSqrtC(2, 0, 1)
-        t2 = ABSqrtC(3, -5, 7)
-        t3 = ABSqrtC(3, 5, 7)
-        t4 = ABSqrtC(2, 10, 7)
-        t5 = ABSqrtC(3, 5, 11)
+        t1 = t357
+        assert 1 + t1 == D(1) + t1 == F(1) + t1 == "1" + t1 == C(4, 5, 7)
 
-        with pytest.raises(ValueError):
-            t2 / t5
+    def test_rsub(self, t357):
+        from decimal import Decimal as D
+        from fractions import Fraction as F
 
-        assert t1 / t1 == ABSqrtC(1, 0, 1)
-        assert t2 / t1 == ABSqrtC(F(3, 2), F(-5, 2), 7)
-        assert t1 / t3 == ABSqrtC(F(-3, 83), F(5, 83), 7)
-        assert t2 / t3 == ABSqrtC(F(-92, 83), F(15, 83), 7)
-        assert t2 / t4 == ABSqrtC(F(-89, 174), F(5, 87), 7)
-        assert (
-            t3 / 2 == t3 / D(2) == t3 / F(2) == t3 / "2" == ABSqrtC(F(3, 2), F(5, 2), 7)
-        )
+        t1 = t357
+        assert 1 - t1 == D(1) - t1 == F(1) - t1 == "1" - t1 == C(-2, -5, 7)
 
-    def test_pow(self):
-        t1 = ABSqrtC(-1, 1, 2)
+    def test_rmul(self, t357):
+        from decimal import Decimal as D
+        from fractions import Fraction as F
 
-        assert t1 ** 2 == ABSqrtC(3, -2, 2)
-        assert t1 ** 3 == ABSqrtC(-7, 5, 2)
-        assert t1 ** 5 == ABSqrtC(-41, 29, 2)
-        assert t1 ** 10 == ABSqrtC(3363, -2378, 2)
+        t1 = t357
+        assert 2 * t1 == D(2) * t1 == F(2) * t1 == "2" * t1 == C(6, 10, 7)
 
-    def test_radd(self):
-        t1 = ABSqrtC(3, 5, 7)
-        assert 1 + t1 == D(1) + t1 == F(1) + t1 == "1" + t1 == ABSqrtC(4, 5, 7)
+    def test_rtruediv(self, t357):
+        from decimal import Decimal as D
+        from fractions import Fraction as F
 
-    def test_rsub(self):
-        t1 = ABSqrtC(3, 5, 7)
-        assert 1 - t1 == D(1) - t1 == F(1) - t1 == "1" - t1 == ABSqrtC(-2, -5, 7)
-
-    def test_rmul(self):
-        t1 = ABSqrtC(3, 5, 7)
-        assert 2 * t1 == D(2) * t1 == F(2) * t1 == "2" * t1 == ABSqrtC(6, 10, 7)
-
-    def test_rtruediv(self):
-        t1 = ABSqrtC(3, 5, 7)
+        t1 = t357
         assert (
             2 / t1
             == D(2) / t1
             == F(2) / t1
             == "2" / t1
-            == ABSqrtC(F(-3, 83), F(5, 83), 7)
+            == C("-3/83", "5/83", 7)
         )
 
-    def test_pow(self):
-        t1 = ABSqrtC(-1, 1, 2)
-
-        assert t1 ** 2 == ABSqrtC(3, -2, 2)
-        assert t1 ** 3 == ABSqrtC(-7, 5, 2)
-        assert t1 ** 5 == ABSqrtC(-41, 29, 2)
-        assert t1 ** 10 == ABSqrtC(3363, -2378, 2)
+    @pytest.mark.parametrize(
+        "n,expected",
+        [
+            (2, (3, -2, 2)),
+            (3, (-7, 5, 2)),
+            (5, (-41, 29, 2)),
+            (10, (3363, -2378, 2)),
+        ],
+    )
+    def test_pow(self, n, expected):
+        assert C(-1, 1, 2) ** n == C(*expected)
 
 
 class TestCalculationsUnary:
     def test_neg(self):
-        assert -ABSqrtC(1, 1, 2) == ABSqrtC(-1, -1, 2)
+        assert -C(1, 1, 2) == C(-1, -1, 2)
 
     def test_abs(self):
-        assert abs(ABSqrtC(2, -1, 2)) == ABSqrtC(2, -1, 2)
-        assert abs(ABSqrtC(1, -1, 2)) == ABSqrtC(-1, 1, 2)
+        assert abs(C(2, -1, 2)) == C(2, -1, 2)
+        assert abs(C(1, -1, 2)) == C(-1, 1, 2)
 
     def test_invert_conjugate(self):
-        t1 = ABSqrtC(1, 1, 2)
+        t1 = C(1, 1, 2)
 
-        assert ~t1 == t1.conjugate == ABSqrtC(1, -1, 2)
+        assert ~t1 == t1.conjugate == C(1, -1, 2)
 
     def test_conjugate_product(self):
-        assert ABSqrtC(1, 1, 2).conjugate_product == -1
-        assert ABSqrtC(4, 2, 3).conjugate_product == 4
+        assert C(1, 1, 2).conjugate_product == -1
+        assert C(4, 2, 3).conjugate_product == 4
 
     def test_inverse(self):
-        assert ABSqrtC(1, 1, 2).inverse == ABSqrtC(-1, 1, 2)
-        assert ABSqrtC(4, 2, 3).inverse == ABSqrtC(1, -F(1 / 2), 3)
+        assert C(1, 1, 2).inverse == C(-1, 1, 2)
+        assert C(4, 2, 3).inverse == C(1, "-1/2", 3)
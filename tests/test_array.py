@@ -0,0 +1,63 @@
+from fractions import Fraction as F
+
+import pytest
+
+from absqrtc import ABSqrtC
+from absqrtc.array import ABSqrtCArray
+
+
+class TestInstance:
+    def test_construction(self):
+        with pytest.raises(ValueError):
+            ABSqrtCArray([ABSqrtC(1, 1, 2), ABSqrtC(1, 1, 3)])
+
+        arr = ABSqrtCArray([ABSqrtC(2), ABSqrtC(1, 1, 7)])
+        assert arr.radical == 7
+        assert len(arr) == 2
+        assert arr[0] == ABSqrtC(2)
+        assert list(arr) == [ABSqrtC(2), ABSqrtC(1, 1, 7)]
+
+    def test_to_list(self):
+        values = [ABSqrtC(3, 5, 7), ABSqrtC(3, -5, 7)]
+        assert ABSqrtCArray(values).to_list() == values
+
+
+class TestCalculations:
+    def test_add(self):
+        arr1 = ABSqrtCArray([ABSqrtC(2, 0, 1), ABSqrtC(3, -5, 7)])
+        arr2 = ABSqrtCArray([ABSqrtC(3, 5, 7), ABSqrtC(3, 5, 7)])
+
+        with pytest.raises(ValueError):
+            arr1 + ABSqrtCArray([ABSqrtC(3, 5, 11), ABSqrtC(3, 5, 11)])
+        with pytest.raises(ValueError):
+            arr1 + ABSqrtCArray([ABSqrtC(3, 5, 7)])
+
+        assert arr1 + arr2 == ABSqrtCArray([ABSqrtC(5, 5, 7), ABSqrtC(6, 0, 1)])
+
+    def test_sub(self):
+        arr1 = ABSqrtCArray([ABSqrtC(2, 0, 1), ABSqrtC(3, -5, 7)])
+        arr2 = ABSqrtCArray([ABSqrtC(3, 5, 7), ABSqrtC(2, -10, 7)])
+
+        assert arr1 - arr2 == ABSqrtCArray([ABSqrtC(-1, -5, 7), ABSqrtC(1, 5, 7)])
+
+    def test_mul(self):
+        arr1 = ABSqrtCArray([ABSqrtC(2, 0, 1), ABSqrtC(3, -5, 7)])
+        arr2 = ABSqrtCArray([ABSqrtC(3, 5, 7), ABSqrtC(2, 10, 7)])
+
+        assert arr1 * arr2 == ABSqrtCArray([ABSqrtC(6, 10, 7), ABSqrtC(-344, 20, 7)])
+
+    def test_pow(self):
+        arr = ABSqrtCArray([ABSqrtC(-1, 1, 2), ABSqrtC(F(1, 2), F(1, 2), 2)])
+
+        assert arr ** 2 == ABSqrtCArray(
+            [ABSqrtC(3, -2, 2), ABSqrtC(F(3, 4), F(1, 2), 2)]
+        )
+        assert arr ** 0 == ABSqrtCArray([ABSqrtC(1), ABSqrtC(1)])
+        assert arr ** -2 == ABSqrtCArray(
+            [ABSqrtC(-1, 1, 2) ** -2, ABSqrtC(F(1, 2), F(1, 2), 2) ** -2]
+        )
+
+    def test_neg(self):
+        arr = ABSqrtCArray([ABSqrtC(2, 0, 1), ABSqrtC(3, -5, 7)])
+
+        assert -arr == ABSqrtCArray([ABSqrtC(-2, 0, 1), ABSqrtC(-3, 5, 7)])